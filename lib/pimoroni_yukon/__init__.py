@@ -5,9 +5,10 @@
 import sys
 import time
 import tca
+import micropython
 from machine import ADC, Pin, I2C
 from pimoroni_yukon.modules import KNOWN_MODULES
-from pimoroni_yukon.modules.common import ADC_FLOAT, ADC_LOW, ADC_HIGH, YukonModule
+from pimoroni_yukon.modules.common import ADC_FLOAT, ADC_LOW, ADC_HIGH, NEG_INF, POS_INF, YukonModule
 import pimoroni_yukon.logging as logging
 from pimoroni_yukon.errors import OverVoltageError, UnderVoltageError, OverCurrentError, OverTemperatureError, FaultError, VerificationError
 from pimoroni_yukon.timing import ticks_ms, ticks_add, ticks_diff
@@ -585,10 +586,17 @@ class Yukon:
 
             tca.change_output_mask(self.__adc_io_chip, self.__adc_io_mask, state)
 
+    @micropython.native
     def __shared_adc_u16(self, samples=1):
+        # A single sample is the common case when monitoring, so return the conversion directly
+        if samples == 1:
+            return self.__shared_adc.read_u16()
+
+        # Sum the samples as ints using a locally bound read, and only divide once at the end
+        read_u16 = self.__shared_adc.read_u16
         val = 0
         for _ in range(samples):
-            val += self.__shared_adc.read_u16()
+            val += read_u16()
         return val / samples
 
     def __shared_adc_voltage(self, samples=1):
@@ -663,7 +671,7 @@ class Yukon:
         temperature = self.read_temperature()
         if temperature > self.__temperature_limit:
             self.disable_main_output()
-            raise OverTemperatureError(f"[Yukon] Temperature of {temperature}°C exceeded the user set limit of {self.__temperature_limit}°C! Turning off output")
+            raise OverTemperatureError("[Yukon] ", temperature, self.__temperature_limit, "user set limit")
 
         # Run some user action based on the latest readings
         if self.__monitor_action_callback is not None:
@@ -784,20 +792,20 @@ class Yukon:
     def __clear_counts_and_readings(self):
         self.__undervoltage_count = 0
 
-        self.__max_voltage_in = float('-inf')
-        self.__min_voltage_in = float('inf')
+        self.__max_voltage_in = NEG_INF
+        self.__min_voltage_in = POS_INF
         self.__avg_voltage_in = 0
 
-        self.__max_voltage_out = float('-inf')
-        self.__min_voltage_out = float('inf')
+        self.__max_voltage_out = NEG_INF
+        self.__min_voltage_out = POS_INF
         self.__avg_voltage_out = 0
 
-        self.__max_current = float('-inf')
-        self.__min_current = float('inf')
+        self.__max_current = NEG_INF
+        self.__min_current = POS_INF
         self.__avg_current = 0
 
-        self.__max_temperature = float('-inf')
-        self.__min_temperature = float('inf')
+        self.__max_temperature = NEG_INF
+        self.__min_temperature = POS_INF
         self.__avg_temperature = 0
 
         self.__count_avg = 0
@@ -19,7 +19,20 @@ class OverCurrentError(Exception):
 
 class OverTemperatureError(Exception):
     """Exception to be used when a temperature value exceeds safe levels"""
-    pass
+    def __init__(self, header, temperature, limit, limit_name="limit"):
+        super().__init__(header, temperature, limit, limit_name)
+        self.header = header
+        self.temperature = temperature
+        self.limit = limit
+        self.limit_name = limit_name
+
+    def __str__(self):
+        # The message is only formatted when needed, rather than every time the exception is raised
+        return f"{self.header}Temperature of {self.temperature}°C exceeded the {self.limit_name} of {self.limit}°C! Turning off output"
+
+    def __repr__(self):
+        # MicroPython prints uncaught exceptions using __repr__, so match its usual "Name: message" format
+        return f"{type(self).__name__}: {self}"
 
 
 class FaultError(Exception):
@@ -2,10 +2,11 @@
 #
 # SPDX-License-Identifier: MIT
 
+import micropython
 import tca
 from machine import Pin
 from ucollections import OrderedDict
-from .common import YukonModule, ADC_FLOAT, IO_LOW, IO_HIGH
+from .common import YukonModule, TemperatureMonitorMixin, ADC_FLOAT, IO_LOW, IO_HIGH
 from pimoroni_yukon.errors import OverTemperatureError
 from pimoroni_yukon.devices.audio import WavPlayer
 
@@ -124,7 +125,7 @@ SDOUT_HIZ_9 = 0x45      # Slots Control Section 8.9.116
 TG_EN = 0x47            # Thermal Detection Enable Section 8.9.117
 
 
-class AudioAmpModule(YukonModule):
+class AudioAmpModule(YukonModule, TemperatureMonitorMixin):
     NAME = "Audio Amp"
     AMP_I2C_ADDRESS = 0x38
     TEMPERATURE_THRESHOLD = 50.0
@@ -133,6 +134,7 @@ class AudioAmpModule(YukonModule):
     # |-------|-------|-------|-------|-------|----------------------|-----------------------------|
     # | FLOAT | ALL   | 0     | 1     | 1     | Audio Amp            |                             |
     @staticmethod
+    @micropython.native
     def is_module(adc1_level, adc2_level, slow1, slow2, slow3):
         return adc1_level == ADC_FLOAT and slow1 is IO_LOW and slow2 is IO_HIGH and slow3 is IO_HIGH
 
@@ -266,34 +268,24 @@ class AudioAmpModule(YukonModule):
     def monitor(self):
         temperature = self.read_temperature()
         if temperature > self.TEMPERATURE_THRESHOLD:
-            raise OverTemperatureError(self.__message_header() + f"Temperature of {temperature}°C exceeded the limit of {self.TEMPERATURE_THRESHOLD}°C! Turning off output")
+            raise OverTemperatureError(self.__header, temperature, self.TEMPERATURE_THRESHOLD)
 
         # Run some user action based on the latest readings
         if self.__monitor_action_callback is not None:
             self.__monitor_action_callback(temperature)
 
-        self.__max_temperature = max(temperature, self.__max_temperature)
-        self.__min_temperature = min(temperature, self.__min_temperature)
-        self.__avg_temperature += temperature
-        self.__count_avg += 1
+        self.__record_temperature(temperature)
 
     def get_readings(self):
-        return OrderedDict({
-            "T_max": self.__max_temperature,
-            "T_min": self.__min_temperature,
-            "T_avg": self.__avg_temperature
-        })
+        readings = OrderedDict()
+        self.__update_temperature_readings(readings)
+        return readings
 
     def process_readings(self):
-        if self.__count_avg > 0:
-            self.__avg_temperature /= self.__count_avg
-            self.__count_avg = 0    # Clear the count to prevent process readings acting more than once
+        self.__process_temperature_readings()
 
     def clear_readings(self):
-        self.__max_temperature = float('-inf')
-        self.__min_temperature = float('inf')
-        self.__avg_temperature = 0
-        self.__count_avg = 0
+        self.__clear_temperature_readings()
 
     def __start_i2c(self):
         tca.change_output_mask(self.__chip, self.__sda_bit, 0)  # Data to low
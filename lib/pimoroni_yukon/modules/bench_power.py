@@ -2,7 +2,8 @@
 #
 # SPDX-License-Identifier: MIT
 
-from .common import YukonModule, ADC_HIGH, IO_LOW, IO_HIGH
+import micropython
+from .common import YukonModule, ADC_HIGH, IO_LOW, IO_HIGH, NEG_INF, POS_INF
 from machine import Pin, PWM
 from ucollections import OrderedDict
 from pimoroni_yukon.errors import FaultError, OverTemperatureError
@@ -28,8 +29,9 @@ class BenchPowerModule(YukonModule):
     # | LOW   | ALL   | 1     | 0     | 0     | Bench Power          | Output Discharged           |
     # | FLOAT | ALL   | 1     | 0     | 0     | Bench Power          | Output Discharging          |
     @staticmethod
+    @micropython.native
     def is_module(adc1_level, adc2_level, slow1, slow2, slow3):
-        return adc1_level is not ADC_HIGH and slow1 is IO_HIGH and slow2 is IO_LOW and slow3 is IO_LOW
+        return adc1_level != ADC_HIGH and slow1 is IO_HIGH and slow2 is IO_LOW and slow3 is IO_LOW
 
     def __init__(self, halt_on_not_pgood=False):
         super().__init__()
@@ -102,18 +104,18 @@ class BenchPowerModule(YukonModule):
         pgood = self.read_power_good()
         if pgood is not True:
             if self.halt_on_not_pgood:
-                raise FaultError(self.__message_header() + "Power is not good! Turning off output")
+                raise FaultError(self.__header + "Power is not good! Turning off output")
 
         temperature = self.read_temperature()
         if temperature > self.TEMPERATURE_THRESHOLD:
-            raise OverTemperatureError(self.__message_header() + f"Temperature of {temperature}°C exceeded the limit of {self.TEMPERATURE_THRESHOLD}°C! Turning off output")
+            raise OverTemperatureError(self.__header, temperature, self.TEMPERATURE_THRESHOLD)
 
         voltage_out = self.read_voltage()
 
         if self.__last_pgood is True and pgood is not True:
-            logging.warn(self.__message_header() + "Power is not good")
+            logging.warn(self.__header + "Power is not good")
         elif self.__last_pgood is not True and pgood is True:
-            logging.warn(self.__message_header() + "Power is good")
+            logging.warn(self.__header + "Power is good")
 
         # Run some user action based on the latest readings
         if self.__monitor_action_callback is not None:
@@ -151,12 +153,12 @@ class BenchPowerModule(YukonModule):
 
     def clear_readings(self):
         self.__power_good_throughout = True
-        self.__max_voltage_out = float('-inf')
-        self.__min_voltage_out = float('inf')
+        self.__max_voltage_out = NEG_INF
+        self.__min_voltage_out = POS_INF
         self.__avg_voltage_out = 0
 
-        self.__max_temperature = float('-inf')
-        self.__min_temperature = float('inf')
+        self.__max_temperature = NEG_INF
+        self.__min_temperature = POS_INF
         self.__avg_temperature = 0
 
         self.__count_avg = 0
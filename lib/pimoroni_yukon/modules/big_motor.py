@@ -2,7 +2,8 @@
 #
 # SPDX-License-Identifier: MIT
 
-from .common import YukonModule, ADC_LOW, IO_LOW, IO_HIGH
+import micropython
+from .common import YukonModule, ADC_LOW, IO_LOW, IO_HIGH, NEG_INF, POS_INF
 from machine import Pin
 from motor import Motor, SLOW_DECAY
 from encoder import Encoder, MMME_CPR
@@ -25,6 +26,7 @@ class BigMotorModule(YukonModule):
     # | LOW   | ALL   | 0     | 0     | 1     | Big Motor            | Not in fault                |
     # | LOW   | ALL   | 0     | 1     | 1     | Big Motor            | In fault                    |
     @staticmethod
+    @micropython.native
     def is_module(adc1_level, adc2_level, slow1, slow2, slow3):
         return adc1_level == ADC_LOW and slow1 is IO_LOW and slow3 is IO_HIGH
 
@@ -109,15 +111,15 @@ class BigMotorModule(YukonModule):
     def monitor(self):
         fault = self.read_fault()
         if fault is True:
-            raise FaultError(self.__message_header() + "Fault detected on motor driver! Turning off output")
+            raise FaultError(self.__header + "Fault detected on motor driver! Turning off output")
 
         current = self.read_current()
         if abs(current) > self.CURRENT_THRESHOLD:
-            raise OverCurrentError(self.__message_header() + f"Current of {current}A exceeded the limit of {self.CURRENT_THRESHOLD}A! Turning off output")
+            raise OverCurrentError(self.__header + f"Current of {current}A exceeded the limit of {self.CURRENT_THRESHOLD}A! Turning off output")
 
         temperature = self.read_temperature()
         if temperature > self.TEMPERATURE_THRESHOLD:
-            raise OverTemperatureError(self.__message_header() + f"Temperature of {temperature}°C exceeded the limit of {self.TEMPERATURE_THRESHOLD}°C! Turning off output")
+            raise OverTemperatureError(self.__header, temperature, self.TEMPERATURE_THRESHOLD)
 
         # Run some user action based on the latest readings
         if self.__monitor_action_callback is not None:
@@ -155,12 +157,12 @@ class BigMotorModule(YukonModule):
     def clear_readings(self):
         self.__fault_triggered = False
 
-        self.__max_current = float('-inf')
-        self.__min_current = float('inf')
+        self.__max_current = NEG_INF
+        self.__min_current = POS_INF
         self.__avg_current = 0
 
-        self.__max_temperature = float('-inf')
-        self.__min_temperature = float('inf')
+        self.__max_temperature = NEG_INF
+        self.__min_temperature = POS_INF
         self.__avg_temperature = 0
 
         self.__count_avg = 0
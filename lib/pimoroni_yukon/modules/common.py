@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 
+import micropython
 from collections import OrderedDict
 from pimoroni_yukon.conversion import analog_to_temp
 import pimoroni_yukon.logging as logging
@@ -12,6 +13,40 @@ ADC_FLOAT = 2
 IO_LOW = False
 IO_HIGH = True
 
+# Starting values for max and min readings, created once rather than on every clear
+NEG_INF = float('-inf')
+POS_INF = float('inf')
+
+
+class TemperatureMonitorMixin:
+    # Tracks the max, min, and average of a module's temperature readings across monitor calls.
+    # Intended to be inherited alongside YukonModule, by modules whose only averaged reading is temperature
+
+    @micropython.native
+    def __record_temperature(self, temperature):
+        if temperature > self.__max_temperature:
+            self.__max_temperature = temperature
+        if temperature < self.__min_temperature:
+            self.__min_temperature = temperature
+        self.__avg_temperature += temperature
+        self.__count_avg += 1
+
+    def __update_temperature_readings(self, readings):
+        readings["T_max"] = self.__max_temperature
+        readings["T_min"] = self.__min_temperature
+        readings["T_avg"] = self.__avg_temperature
+
+    def __process_temperature_readings(self):
+        if self.__count_avg > 0:
+            self.__avg_temperature /= self.__count_avg
+            self.__count_avg = 0    # Clear the count to prevent process readings acting more than once
+
+    def __clear_temperature_readings(self):
+        self.__max_temperature = NEG_INF
+        self.__min_temperature = POS_INF
+        self.__avg_temperature = 0
+        self.__count_avg = 0
+
 
 class YukonModule:
     NAME = "Unknown"
@@ -20,14 +55,16 @@ class YukonModule:
     # |-------|-------|-------|-------|-------|----------------------|-----------------------------|
     # | FLOAT | HIGH  | 1     | 1     | 1     | Empty                |                             |
     @staticmethod
+    @micropython.native
     def is_module(adc1_level, adc2_level, slow1, slow2, slow3):
         # This will return true if a slot is detected as not being empty, so as to give useful error information
-        return adc1_level is not ADC_FLOAT or adc2_level is not ADC_HIGH or slow1 is not IO_HIGH or slow2 is not IO_HIGH or slow3 is not IO_HIGH
+        return adc1_level != ADC_FLOAT or adc2_level != ADC_HIGH or slow1 is not IO_HIGH or slow2 is not IO_HIGH or slow3 is not IO_HIGH
 
     def __init__(self):
         self.slot = None
         self.__adc1_func = None
         self.__adc2_func = None
+        self.__header = None
 
         self.clear_readings()
 
@@ -39,6 +76,9 @@ class YukonModule:
         self.__adc1_func = adc1_func
         self.__adc2_func = adc2_func
 
+        # The slot cannot change whilst initialised, so create the header for log and error messages just once
+        self.__header = self.__message_header()
+
         # Put any objects created during initialisation into a known state
         self.reset()
 
@@ -49,6 +89,7 @@ class YukonModule:
         self.slot = None
         self.__adc1_func = None
         self.__adc2_func = None
+        self.__header = None
 
     def reset(self):
         # Override this to reset the module back into a default state post-initialisation
@@ -2,14 +2,15 @@
 #
 # SPDX-License-Identifier: MIT
 
-from .common import YukonModule, ADC_FLOAT, IO_LOW, IO_HIGH
+import micropython
+from .common import YukonModule, TemperatureMonitorMixin, ADC_FLOAT, IO_LOW, IO_HIGH
 from machine import Pin
 from ucollections import OrderedDict
 from pimoroni_yukon.errors import FaultError, OverTemperatureError
 import pimoroni_yukon.logging as logging
 
 
-class DualOutputModule(YukonModule):
+class DualOutputModule(YukonModule, TemperatureMonitorMixin):
     NAME = "Dual Switched Output"
     OUTPUT_1 = 0
     OUTPUT_2 = 1
@@ -20,6 +21,7 @@ class DualOutputModule(YukonModule):
     # |-------|-------|-------|-------|-------|----------------------|-----------------------------|
     # | FLOAT | ALL   | 1     | 0     | 1     | Dual Switched Output |                             |
     @staticmethod
+    @micropython.native
     def is_module(adc1_level, adc2_level, slow1, slow2, slow3):
         return adc1_level == ADC_FLOAT and slow1 is IO_HIGH and slow2 is IO_LOW and slow3 is IO_HIGH
 
@@ -101,25 +103,25 @@ class DualOutputModule(YukonModule):
         pgood1 = self.read_power_good1()
         if pgood1 is not True:
             if self.halt_on_not_pgood:
-                raise FaultError(self.__message_header() + "Power1 is not good! Turning off output")
+                raise FaultError(self.__header + "Power1 is not good! Turning off output")
         pgood2 = self.read_power_good2()
         if pgood2 is not True:
             if self.halt_on_not_pgood:
-                raise FaultError(self.__message_header() + "Power2 is not good! Turning off output")
+                raise FaultError(self.__header + "Power2 is not good! Turning off output")
 
         temperature = self.read_temperature()
         if temperature > self.TEMPERATURE_THRESHOLD:
-            raise OverTemperatureError(self.__message_header() + f"Temperature of {temperature}°C exceeded the limit of {self.TEMPERATURE_THRESHOLD}°C! Turning off output")
+            raise OverTemperatureError(self.__header, temperature, self.TEMPERATURE_THRESHOLD)
 
         if self.__last_pgood1 is True and pgood1 is not True:
-            logging.warn(self.__message_header() + "Power1 is not good")
+            logging.warn(self.__header + "Power1 is not good")
         elif self.__last_pgood1 is not True and pgood1 is True:
-            logging.warn(self.__message_header() + "Power1 is good")
+            logging.warn(self.__header + "Power1 is good")
 
         if self.__last_pgood2 is True and pgood2 is not True:
-            logging.warn(self.__message_header() + "Power2 is not good")
+            logging.warn(self.__header + "Power2 is not good")
         elif self.__last_pgood2 is not True and pgood2 is True:
-            logging.warn(self.__message_header() + "Power2 is good")
+            logging.warn(self.__header + "Power2 is good")
 
         # Run some user action based on the latest readings
         if self.__monitor_action_callback is not None:
@@ -130,29 +132,19 @@ class DualOutputModule(YukonModule):
         self.__power_good_throughout1 = self.__power_good_throughout1 and pgood1
         self.__power_good_throughout2 = self.__power_good_throughout2 and pgood2
 
-        self.__max_temperature = max(temperature, self.__max_temperature)
-        self.__min_temperature = min(temperature, self.__min_temperature)
-        self.__avg_temperature += temperature
-        self.__count_avg += 1
+        self.__record_temperature(temperature)
 
     def get_readings(self):
-        return OrderedDict({
-            "PGood1": self.__power_good_throughout1,
-            "PGood2": self.__power_good_throughout2,
-            "T_max": self.__max_temperature,
-            "T_min": self.__min_temperature,
-            "T_avg": self.__avg_temperature
-        })
+        readings = OrderedDict()
+        readings["PGood1"] = self.__power_good_throughout1
+        readings["PGood2"] = self.__power_good_throughout2
+        self.__update_temperature_readings(readings)
+        return readings
 
     def process_readings(self):
-        if self.__count_avg > 0:
-            self.__avg_temperature /= self.__count_avg
-            self.__count_avg = 0    # Clear the count to prevent process readings acting more than once
+        self.__process_temperature_readings()
 
     def clear_readings(self):
         self.__power_good_throughout1 = True
         self.__power_good_throughout2 = True
-        self.__max_temperature = float('-inf')
-        self.__min_temperature = float('inf')
-        self.__avg_temperature = 0
-        self.__count_avg = 0
+        self.__clear_temperature_readings()
@@ -2,14 +2,15 @@
 #
 # SPDX-License-Identifier: MIT
 
-from .common import YukonModule, ADC_LOW, IO_HIGH
+import micropython
+from .common import YukonModule, TemperatureMonitorMixin, ADC_LOW, IO_HIGH
 from machine import Pin
 from ucollections import OrderedDict
 from pimoroni_yukon.errors import FaultError, OverTemperatureError
 import pimoroni_yukon.logging as logging
 
 
-class LEDStripModule(YukonModule):
+class LEDStripModule(YukonModule, TemperatureMonitorMixin):
     NAME = "LED Strip"
     NEOPIXEL = 0
     DUAL_NEOPIXEL = 1
@@ -23,6 +24,7 @@ class LEDStripModule(YukonModule):
     # |-------|-------|-------|-------|-------|----------------------|-----------------------------|
     # | LOW   | ALL   | 1     | 1     | 1     | LED Strip            |                             |
     @staticmethod
+    @micropython.native
     def is_module(adc1_level, adc2_level, slow1, slow2, slow3):
         return adc1_level == ADC_LOW and slow1 is IO_HIGH and slow2 is IO_HIGH and slow3 is IO_HIGH
 
@@ -131,16 +133,16 @@ class LEDStripModule(YukonModule):
         pgood = self.read_power_good()
         if pgood is not True:
             if self.halt_on_not_pgood:
-                raise FaultError(self.__message_header() + "Power is not good! Turning off output")
+                raise FaultError(self.__header + "Power is not good! Turning off output")
 
         temperature = self.read_temperature()
         if temperature > self.TEMPERATURE_THRESHOLD:
-            raise OverTemperatureError(self.__message_header() + f"Temperature of {temperature}°C exceeded the limit of {self.TEMPERATURE_THRESHOLD}°C! Turning off output")
+            raise OverTemperatureError(self.__header, temperature, self.TEMPERATURE_THRESHOLD)
 
         if self.__last_pgood is True and pgood is not True:
-            logging.warn(self.__message_header() + "Power is not good")
+            logging.warn(self.__header + "Power is not good")
         elif self.__last_pgood is not True and pgood is True:
-            logging.warn(self.__message_header() + "Power is good")
+            logging.warn(self.__header + "Power is good")
 
         # Run some user action based on the latest readings
         if self.__monitor_action_callback is not None:
@@ -149,27 +151,17 @@ class LEDStripModule(YukonModule):
         self.__last_pgood = pgood
         self.__power_good_throughout = self.__power_good_throughout and pgood
 
-        self.__max_temperature = max(temperature, self.__max_temperature)
-        self.__min_temperature = min(temperature, self.__min_temperature)
-        self.__avg_temperature += temperature
-        self.__count_avg += 1
+        self.__record_temperature(temperature)
 
     def get_readings(self):
-        return OrderedDict({
-            "PGood": self.__power_good_throughout,
-            "T_max": self.__max_temperature,
-            "T_min": self.__min_temperature,
-            "T_avg": self.__avg_temperature
-        })
+        readings = OrderedDict()
+        readings["PGood"] = self.__power_good_throughout
+        self.__update_temperature_readings(readings)
+        return readings
 
     def process_readings(self):
-        if self.__count_avg > 0:
-            self.__avg_temperature /= self.__count_avg
-            self.__count_avg = 0    # Clear the count to prevent process readings acting more than once
+        self.__process_temperature_readings()
 
     def clear_readings(self):
         self.__power_good_throughout = True
-        self.__max_temperature = float('-inf')
-        self.__min_temperature = float('inf')
-        self.__avg_temperature = 0
-        self.__count_avg = 0
+        self.__clear_temperature_readings()
@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 
+import micropython
 from .common import YukonModule, ADC_FLOAT, ADC_HIGH, IO_LOW, IO_HIGH
 
 
@@ -14,8 +15,9 @@ class ProtoPotModule(YukonModule):
     # | FLOAT | HIGH  | 1     | 1     | 0     | Proto Potentiometer  | Pot in middle position      |
     # | HIGH  | HIGH  | 1     | 1     | 0     | Proto Potentiometer  | Pot in high position        |
     @staticmethod
+    @micropython.native
     def is_module(adc1_level, adc2_level, slow1, slow2, slow3):
-        return adc2_level is ADC_HIGH and slow1 is IO_HIGH and slow2 is IO_HIGH and slow3 is IO_LOW
+        return adc2_level == ADC_HIGH and slow1 is IO_HIGH and slow2 is IO_HIGH and slow3 is IO_LOW
 
     def __init__(self):
         super().__init__()
@@ -35,8 +37,9 @@ class ProtoPotModule2(YukonModule):
     # | FLOAT | FLOAT | 1     | 1     | 0     | Proto Potentiometer  | Pot in middle position      |
     # | FLOAT | HIGH  | 1     | 1     | 0     | Proto Potentiometer  | Pot in high position        |
     @staticmethod
+    @micropython.native
     def is_module(adc1_level, adc2_level, slow1, slow2, slow3):
-        return adc1_level is ADC_FLOAT and slow1 is IO_HIGH and slow2 is IO_HIGH and slow3 is IO_LOW
+        return adc1_level == ADC_FLOAT and slow1 is IO_HIGH and slow2 is IO_HIGH and slow3 is IO_LOW
 
     # ADC2 has a pull-up connected to simplify its use with modules that feature an onboard thermistor.
     # Unfortunately, when connecting up a potentiometer, creating the below circuit, this has the
@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 
+import micropython
 from .common import YukonModule, IO_LOW
 from servo import Servo
 
@@ -26,6 +27,7 @@ class QuadServoDirectModule(YukonModule):
     # | FLOAT | HIGH  | 0     | 0     | 0     | Quad Servo Direct    | A1 between.   A2 near 3.3V  |
     # | HIGH  | HIGH  | 0     | 0     | 0     | Quad Servo Direct    | A1 near 3.3V. A2 near 3.3V  |
     @staticmethod
+    @micropython.native
     def is_module(adc1_level, adc2_level, slow1, slow2, slow3):
         return slow1 is IO_LOW and slow2 is IO_LOW and slow3 is IO_LOW
 
@@ -39,7 +41,7 @@ class QuadServoDirectModule(YukonModule):
 
         if self.__init_servos:
             # Create servo objects
-            self.servos = [Servo(pins[i], freq=50) for i in range(len(pins))]
+            self.servos = [Servo(pin, freq=50) for pin in pins]
         else:
             self.servo_pins = pins
 
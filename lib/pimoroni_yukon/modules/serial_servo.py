@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 
+import micropython
 from .common import YukonModule, ADC_HIGH, IO_LOW, IO_HIGH
 from machine import Pin, UART
 
@@ -33,8 +34,9 @@ class SerialServoModule(YukonModule):
     # |-------|-------|-------|-------|-------|----------------------|-----------------------------|
     # | HIGH  | HIGH  | 1     | 0     | 0     | Serial Servo         |                             |
     @staticmethod
+    @micropython.native
     def is_module(adc1_level, adc2_level, slow1, slow2, slow3):
-        return adc1_level is ADC_HIGH and adc2_level is ADC_HIGH and slow1 is IO_HIGH and slow2 is IO_LOW and slow3 is IO_LOW
+        return adc1_level == ADC_HIGH and adc2_level == ADC_HIGH and slow1 is IO_HIGH and slow2 is IO_LOW and slow3 is IO_LOW
 
     def __init__(self, baudrate=DEFAULT_BAUDRATE):
         super().__init__()